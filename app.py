@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator
+
 import streamlit as st
 
 from src.config import Settings, get_settings
-from src.qa_chain import VideoKnowledgeBase, answer_question
-from src.summarizer import summarize_documents
-from src.transcript_loader import build_documents
+from src.qa_chain import VideoKnowledgeBase, stream_answer
+from src.summarizer import stream_summary
+from src.transcript_loader import build_documents, restore_documents
 from src.youtube_client import YouTubeClient, get_metadata_and_transcript
 
 st.set_page_config(page_title="YouTube Video Q&A Bot", page_icon="🎬", layout="wide")
 
+logger = logging.getLogger(__name__)
+
 
 def init_app_state():
     if "settings" not in st.session_state:
@@ -26,6 +32,41 @@ def init_app_state():
         st.session_state.qa_last_answer = None
 
 
+@st.cache_resource
+def get_background_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for work that should overlap with the UI."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="video-worker")
+
+
+def log_background_failure(future: Future) -> None:
+    """Log the error from a background task nobody waits on."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Background index build failed", exc_info=exc)
+
+
+def spin_until_first_chunk(chunks: Iterator[str], message: str) -> Iterator[str]:
+    """Show a spinner until ``chunks`` yields its first piece, then pass it all through."""
+    with st.spinner(message):
+        first = next(chunks, None)
+    if first is None:
+        return
+    yield first
+    yield from chunks
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def fetch_video_payload(
+    _client: YouTubeClient,
+    video_id: str,
+    languages: tuple[str, ...] = (),
+) -> dict[str, str | None]:
+    """Fetch metadata and transcript once per video and reuse across sessions."""
+    return get_metadata_and_transcript(_client, video_id, languages=languages or None)
+
+
 def load_video(video_input: str):
     settings: Settings = st.session_state.settings
     video_id = YouTubeClient.parse_video_id(video_input)
@@ -36,7 +77,7 @@ def load_video(video_input: str):
     client = YouTubeClient(settings.youtube_api_key)
     with st.spinner("Fetching transcript and metadata..."):
         try:
-            payload = get_metadata_and_transcript(client, video_id)
+            payload = fetch_video_payload(client, video_id)
         except Exception as exc:  # noqa: BLE001 - surface precise error to user
             st.error(f"Failed to retrieve video data: {exc}")
             return
@@ -54,25 +95,38 @@ def load_video(video_input: str):
     }
     documents = build_documents(transcript_text, metadata=metadata)
 
-    summary = None
-    with st.spinner("Generating summary..."):
-        summary = summarize_documents(documents)
+    # Embed the transcript while the summary is generated and the user reads
+    # it; answering waits on an in-flight build instead of starting another.
+    knowledge_base: VideoKnowledgeBase = st.session_state.knowledge_base
+    index_future = get_background_executor().submit(
+        knowledge_base.ensure_index, video_id, documents
+    )
+    index_future.add_done_callback(log_background_failure)
+
+    # Stream the summary into a transient placeholder so the user sees it
+    # being written; the Summary panel renders the stored copy afterwards.
+    placeholder = st.empty()
+    with placeholder.container():
+        summary = st.write_stream(
+            spin_until_first_chunk(stream_summary(documents), "Generating summary...")
+        )
+    placeholder.empty()
+    if not isinstance(summary, str):
+        summary = None
 
     st.session_state.videos[video_id] = {
         "input": video_input,
-        "metadata": payload,
-        "documents": documents,
+        # The video info card only needs the YouTube metadata, not the transcript.
+        "metadata": {key: value for key, value in payload.items() if key != "transcript"},
+        # Keep a compact manifest; Document objects are rebuilt when needed.
+        "chunk_texts": [doc.page_content for doc in documents],
+        "chunk_metadata": metadata,
         "summary": summary,
     }
     st.session_state.selected_video = video_id
     st.session_state.qa_last_answer = None
 
 
-@st.cache_data(show_spinner=False)
-def render_metadata_card(payload: dict[str, str | None]) -> dict[str, str | None]:
-    return payload
-
-
 def main():
     init_app_state()
 
@@ -90,7 +144,6 @@ def main():
         selected_video = st.session_state.get("selected_video")
         if selected_video:
             video_state = st.session_state.videos[selected_video]
-            metadata = video_state.get("metadata") or {}
 
             st.subheader("Summary")
             st.write(video_state.get("summary") or "No summary available.")
@@ -102,17 +155,27 @@ def main():
                     st.warning("Enter a question first.")
                 else:
                     knowledge_base: VideoKnowledgeBase = st.session_state.knowledge_base
-                    documents = video_state.get("documents")
-                    if not documents:
+                    chunk_texts = video_state.get("chunk_texts")
+                    if not chunk_texts:
                         st.error("No documents are loaded for this video. Try reloading it.")
                     else:
-                        with st.spinner("Thinking..."):
-                            answer = answer_question(
+                        documents = restore_documents(
+                            chunk_texts, metadata=video_state.get("chunk_metadata")
+                        )
+                        placeholder = st.empty()
+                        with placeholder.container():
+                            chunks = stream_answer(
                                 selected_video,
                                 question=question,
                                 knowledge_base=knowledge_base,
                                 documents=documents,
                             )
+                            answer = st.write_stream(
+                                spin_until_first_chunk(chunks, "Thinking...")
+                            )
+                        placeholder.empty()
+                        if not isinstance(answer, str):
+                            answer = None
                         if answer:
                             st.session_state.qa_last_answer = {
                                 "question": question,
@@ -131,12 +194,11 @@ def main():
             video_state = st.session_state.videos[selected_video]
             metadata = video_state.get("metadata") or {}
             st.subheader("Video info")
-            card = render_metadata_card(metadata)
-            title = card.get("title") or "Unknown title"
+            title = metadata.get("title") or "Unknown title"
             st.markdown(f"**{title}**")
-            st.markdown(f"Channel: {card.get('channel_title') or 'Unknown'}")
-            st.markdown(f"Published: {card.get('published_at') or 'Unknown'}")
-            description = card.get("description")
+            st.markdown(f"Channel: {metadata.get('channel_title') or 'Unknown'}")
+            st.markdown(f"Published: {metadata.get('published_at') or 'Unknown'}")
+            description = metadata.get("description")
             if description:
                 with st.expander("Description", expanded=False):
                     st.write(description)
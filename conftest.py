@@ -0,0 +1,7 @@
+"""Pytest setup shared by the test suite."""
+
+import os
+
+# The settings loader requires API keys; tests never reach the network.
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("YOUTUBE_API_KEY", "test-youtube-key")
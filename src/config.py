@@ -21,11 +21,16 @@ class Settings:
     openai_model: str = "gpt-4o-mini"
     embedding_model: str = "text-embedding-3-large"
     summarize_prompt_name: str = "map_reduce"
+    summarize_stuff_token_limit: int = 100_000
+    summarize_max_concurrency: int = 8
     max_summary_tokens: int = 400
-    chunk_size: int = 1200
-    chunk_overlap: int = 200
+    chunk_size: int = 400
+    chunk_overlap: int = 50
+    child_chunk_size: int = 80
+    child_chunk_overlap: int = 10
     top_k: int = 6
     temperature: float = 0.2
+    cache_dir: str = ".cache"
 
     @classmethod
     def load(cls, *, raise_on_missing: bool = True) -> "Settings":
@@ -51,11 +56,19 @@ class Settings:
         openai_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini").strip()
         embedding_model = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-large").strip()
         summarize_prompt_name = os.getenv("SUMMARIZE_PROMPT", "map_reduce").strip()
+        summarize_stuff_token_limit = int(os.getenv("SUMMARIZE_STUFF_TOKEN_LIMIT", "100000"))
+        summarize_max_concurrency = int(os.getenv("SUMMARIZE_MAX_CONCURRENCY", "8"))
         max_summary_tokens = int(os.getenv("MAX_SUMMARY_TOKENS", "400"))
-        chunk_size = int(os.getenv("CHUNK_SIZE", "1200"))
-        chunk_overlap = int(os.getenv("CHUNK_OVERLAP", "200"))
+        # Chunk sizes are in tokens. The variable names changed along with
+        # the unit, so old character-based CHUNK_SIZE/CHUNK_OVERLAP values
+        # are ignored rather than read as token counts.
+        chunk_size = int(os.getenv("CHUNK_TOKENS", "400"))
+        chunk_overlap = int(os.getenv("CHUNK_OVERLAP_TOKENS", "50"))
+        child_chunk_size = int(os.getenv("CHILD_CHUNK_TOKENS", "80"))
+        child_chunk_overlap = int(os.getenv("CHILD_CHUNK_OVERLAP_TOKENS", "10"))
         top_k = int(os.getenv("TOP_K", "6"))
         temperature = float(os.getenv("TEMPERATURE", "0.2"))
+        cache_dir = os.getenv("CACHE_DIR", ".cache").strip()
 
         return cls(
             openai_api_key=openai_api_key,
@@ -63,11 +76,16 @@ class Settings:
             openai_model=openai_model or "gpt-4o-mini",
             embedding_model=embedding_model or "text-embedding-3-large",
             summarize_prompt_name=summarize_prompt_name or "map_reduce",
+            summarize_stuff_token_limit=summarize_stuff_token_limit,
+            summarize_max_concurrency=summarize_max_concurrency,
             max_summary_tokens=max_summary_tokens,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
+            child_chunk_size=child_chunk_size,
+            child_chunk_overlap=child_chunk_overlap,
             top_k=top_k,
             temperature=temperature,
+            cache_dir=cache_dir or ".cache",
         )
 
 
@@ -2,52 +2,299 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
-from langchain.chains import RetrievalQA
+import numpy as np
 from langchain_core.documents import Document
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.embeddings import Embeddings
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from langchain_community.vectorstores import FAISS
 
 from .config import Settings, get_settings
+from .transcript_loader import CHUNK_ENCODING, CHUNKING_VERSION, build_child_documents
+
+logger = logging.getLogger(__name__)
+
+_SYSTEM_PROMPT = (
+    "You answer questions about a YouTube video using only the transcript "
+    "excerpts provided as context. If the context does not contain the "
+    "answer, say that you don't know."
+)
+_CONTEXT_SEPARATOR = "\n\n---\n\n"
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class TinyVectorStore:
+    """Brute-force cosine-similarity search over a single video's chunks.
+
+    A transcript yields at most a few hundred chunks, where one matrix-vector
+    product beats building and querying an approximate index.
+    """
+
+    _VECTORS_FILE = "vectors.npy"
+    _DOCUMENTS_FILE = "documents.json"
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        vectors: np.ndarray,
+        documents: List[Document],
+    ) -> None:
+        # ``vectors`` must already be L2-normalized; see ``from_embeddings``.
+        if len(vectors) != len(documents):
+            raise ValueError("Each document needs exactly one vector.")
+        self._embeddings = embeddings
+        self._vectors = vectors
+        self._documents = documents
+
+    @classmethod
+    def from_embeddings(
+        cls,
+        vectors: Sequence[Sequence[float]],
+        documents: List[Document],
+        embeddings: Embeddings,
+    ) -> "TinyVectorStore":
+        # Normalize once at insert time so queries are a plain dot product.
+        return cls(embeddings, _normalize(np.asarray(vectors, dtype=np.float32)), documents)
+
+    def similarity_search(self, query: str, k: int = 4) -> List[Document]:
+        """Return the ``k`` documents most similar to ``query``, best first."""
+        if not self._documents or k <= 0:
+            return []
+        # Scaling the query does not change the ranking, so it is left as is.
+        query_vector = np.asarray(self._embeddings.embed_query(query), dtype=np.float32)
+        scores = self._vectors @ query_vector
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [self._documents[i] for i in top]
+
+    @classmethod
+    def exists_local(cls, path: str) -> bool:
+        """Return True if a complete index has been saved at ``path``."""
+        return all(
+            os.path.isfile(os.path.join(path, name))
+            for name in (cls._VECTORS_FILE, cls._DOCUMENTS_FILE)
+        )
+
+    def save_local(self, path: str) -> None:
+        """Save the index to ``path``, replacing it atomically.
+
+        Files are written to a sibling temp directory that is then renamed into
+        place, so readers never see a half-written index.
+        """
+        parent = os.path.dirname(path) or "."
+        os.makedirs(parent, exist_ok=True)
+        tmp_path = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+        try:
+            np.save(os.path.join(tmp_path, self._VECTORS_FILE), self._vectors)
+            payload = [
+                {"page_content": doc.page_content, "metadata": doc.metadata}
+                for doc in self._documents
+            ]
+            with open(os.path.join(tmp_path, self._DOCUMENTS_FILE), "w", encoding="utf-8") as fh:
+                json.dump(payload, fh)
+            # A directory can only be renamed over an empty one, so clear out
+            # a previous (possibly broken) index first.
+            shutil.rmtree(path, ignore_errors=True)
+            try:
+                os.replace(tmp_path, path)
+            except OSError:
+                # Another writer got there first; its index is just as good.
+                if not self.exists_local(path):
+                    raise
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    @classmethod
+    def load_local(cls, path: str, embeddings: Embeddings) -> "TinyVectorStore":
+        # Vectors were saved normalized, so they are used as loaded.
+        vectors = np.load(os.path.join(path, cls._VECTORS_FILE))
+        with open(os.path.join(path, cls._DOCUMENTS_FILE), encoding="utf-8") as fh:
+            payload = json.load(fh)
+        documents = [Document(**item) for item in payload]
+        return cls(embeddings, vectors, documents)
 
 
 @dataclass
 class VideoKnowledgeBase:
-    """In-memory store of FAISS indexes per video id."""
+    """Vector indexes per video id, cached in memory and persisted to disk."""
 
     settings: Settings = field(default_factory=get_settings)
-    _indexes: Dict[str, FAISS] = field(default_factory=dict)
+    _indexes: Dict[str, TinyVectorStore] = field(default_factory=dict)
+    _parents: Dict[str, Dict[int, Document]] = field(default_factory=dict)
+    _embeddings: OpenAIEmbeddings = field(init=False, repr=False)
+    _locks: Dict[str, threading.Lock] = field(default_factory=dict, repr=False)
+    _locks_guard: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
-    @property
-    def embeddings(self) -> OpenAIEmbeddings:
-        return OpenAIEmbeddings(
+    def __post_init__(self) -> None:
+        # Build the embeddings client once so its HTTP pool is reused.
+        self._embeddings = OpenAIEmbeddings(
             openai_api_key=self.settings.openai_api_key,
             model=self.settings.embedding_model,
+            chunk_size=512,
+        )
+
+    @property
+    def embeddings(self) -> OpenAIEmbeddings:
+        return self._embeddings
+
+    def _index_path(self, video_id: str) -> str:
+        # Key the on-disk cache on the settings that shape the vectors so a
+        # config change never loads a stale index.
+        fingerprint = "|".join(
+            (
+                self.settings.embedding_model,
+                CHUNK_ENCODING,
+                CHUNKING_VERSION,
+                str(self.settings.chunk_size),
+                str(self.settings.chunk_overlap),
+                str(self.settings.child_chunk_size),
+                str(self.settings.child_chunk_overlap),
+            )
         )
+        digest = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.settings.cache_dir, "vectors", video_id, digest)
 
-    def build_index(self, video_id: str, documents: Iterable[Document]) -> FAISS:
-        docs = list(documents)
-        if not docs:
+    def _remember_parents(self, video_id: str, documents: Iterable[Document]) -> None:
+        self._parents[video_id] = {
+            doc.metadata["parent_id"]: doc
+            for doc in documents
+            if "parent_id" in doc.metadata
+        }
+
+    def build_index(self, video_id: str, documents: Iterable[Document]) -> TinyVectorStore:
+        """Index small child chunks of ``documents`` for retrieval."""
+        parents = list(documents)
+        if not parents:
             raise ValueError("Cannot build an index without documents.")
-        store = FAISS.from_documents(docs, self.embeddings)
+        self._remember_parents(video_id, parents)
+        docs = build_child_documents(parents)
+        embeddings = self.embeddings
+        # Embed every chunk up front so the whole transcript goes out in as
+        # few API round-trips as the batch size allows.
+        vectors = embeddings.embed_documents([doc.page_content for doc in docs])
+        store = TinyVectorStore.from_embeddings(vectors, docs, embeddings)
+        path = self._index_path(video_id)
+        try:
+            store.save_local(path)
+        except OSError as exc:
+            # The disk cache is an optimization; keep serving from memory.
+            logger.warning("Could not write index cache at %s: %s", path, exc)
+        self._indexes[video_id] = store
+        return store
+
+    def get_index(self, video_id: str) -> Optional[TinyVectorStore]:
+        store = self._indexes.get(video_id)
+        if store is not None:
+            return store
+        path = self._index_path(video_id)
+        if not TinyVectorStore.exists_local(path):
+            return None
+        try:
+            store = TinyVectorStore.load_local(path, self.embeddings)
+        except (OSError, ValueError) as exc:
+            # Treat an unreadable cache entry as a miss so it gets rebuilt.
+            logger.warning("Ignoring unreadable index cache at %s: %s", path, exc)
+            return None
         self._indexes[video_id] = store
         return store
 
-    def get_index(self, video_id: str) -> Optional[FAISS]:
-        return self._indexes.get(video_id)
+    def ensure_index(self, video_id: str, documents: Iterable[Document]) -> TinyVectorStore:
+        """Return the index for a video, building it if needed.
+
+        Safe to call from several threads: a caller arriving while another
+        thread is building the same index waits for it instead of embedding
+        the transcript a second time.
+        """
+        with self._locks_guard:
+            lock = self._locks.setdefault(video_id, threading.Lock())
+        with lock:
+            store = self.get_index(video_id)
+            if store is None:
+                return self.build_index(video_id, documents)
+            if video_id not in self._parents:
+                self._remember_parents(video_id, documents)
+            return store
+
+    def expand_to_parents(self, video_id: str, children: Iterable[Document]) -> List[Document]:
+        """Map retrieved child chunks to their distinct parent chunks, in rank order."""
+        parents = self._parents.get(video_id, {})
+        seen = set()
+        expanded: List[Document] = []
+        for child in children:
+            parent_id = child.metadata.get("parent_id")
+            if parent_id in seen:
+                continue
+            seen.add(parent_id)
+            expanded.append(parents.get(parent_id, child))
+        return expanded
+
+
+@lru_cache(maxsize=4)
+def _get_chat_model(api_key: str, model: str, temperature: float) -> ChatOpenAI:
+    """Return a shared chat model client for the given configuration."""
+    return ChatOpenAI(
+        openai_api_key=api_key,
+        model=model,
+        temperature=temperature,
+        streaming=True,
+    )
+
+
+def build_qa_messages(context_docs: Iterable[Document], question: str) -> List[BaseMessage]:
+    """Assemble the chat prompt from retrieved transcript chunks."""
+    context = _CONTEXT_SEPARATOR.join(doc.page_content for doc in context_docs)
+    return [
+        SystemMessage(content=_SYSTEM_PROMPT),
+        HumanMessage(content=f"Context:\n{context}\n\nQuestion: {question}"),
+    ]
 
 
-def build_qa_chain(vector_store: FAISS, *, settings: Optional[Settings] = None) -> RetrievalQA:
-    settings = settings or get_settings()
-    llm = ChatOpenAI(
-        openai_api_key=settings.openai_api_key,
-        model=settings.openai_model,
-        temperature=settings.temperature,
+def _prepare_question(
+    video_id: str,
+    question: str,
+    knowledge_base: VideoKnowledgeBase,
+    documents: Iterable[Document],
+) -> tuple[ChatOpenAI, List[BaseMessage]]:
+    settings = knowledge_base.settings
+    store = knowledge_base.ensure_index(video_id, documents)
+    children = store.similarity_search(question, k=settings.top_k)
+    context_docs = knowledge_base.expand_to_parents(video_id, children)
+    llm = _get_chat_model(
+        settings.openai_api_key,
+        settings.openai_model,
+        settings.temperature,
     )
-    retriever = vector_store.as_retriever(search_kwargs={"k": settings.top_k})
-    return RetrievalQA.from_chain_type(llm, retriever=retriever, chain_type="stuff")
+    return llm, build_qa_messages(context_docs, question)
+
+
+def stream_answer(
+    video_id: str,
+    *,
+    question: str,
+    knowledge_base: VideoKnowledgeBase,
+    documents: Iterable[Document],
+) -> Iterator[str]:
+    """Yield the answer to a question token by token as it is generated."""
+    llm, messages = _prepare_question(video_id, question, knowledge_base, documents)
+    for chunk in llm.stream(messages):
+        if chunk.content:
+            yield str(chunk.content)
 
 
 def answer_question(
@@ -58,12 +305,6 @@ def answer_question(
     documents: Iterable[Document],
 ) -> str:
     """Ensure an index exists for the video and answer the question."""
-    store = knowledge_base.get_index(video_id)
-    if store is None:
-        store = knowledge_base.build_index(video_id, documents)
-
-    chain = build_qa_chain(store, settings=knowledge_base.settings)
-    result = chain.invoke({"query": question})
-    if isinstance(result, dict):
-        return result.get("result") or result.get("output_text") or ""
-    return str(result)
+    llm, messages = _prepare_question(video_id, question, knowledge_base, documents)
+    result = llm.invoke(messages)
+    return str(result.content or "")
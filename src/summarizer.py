@@ -2,37 +2,122 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+import asyncio
+from typing import Iterable, Iterator, List, Optional
 
+import httpx
+import tiktoken
 from langchain.chains.summarize import load_summarize_chain
+from langchain.chains.summarize.stuff_prompt import PROMPT as STUFF_PROMPT
 from langchain_core.documents import Document
 from langchain_openai import ChatOpenAI
 
 from .config import get_settings
 
+# Matches the ``stuff`` chain's default document separator.
+_STUFF_SEPARATOR = "\n\n"
 
-def build_summarizer():
-    """Construct the LangChain summarize chain."""
+
+def _count_tokens(documents: Iterable[Document], model: str) -> int:
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    return sum(len(encoding.encode(doc.page_content)) for doc in documents)
+
+
+def choose_chain_type(documents: List[Document]) -> str:
+    """Pick the summarize chain type for the given documents.
+
+    The default ``map_reduce`` issues one LLM call per chunk plus a reduce
+    step; when the whole transcript fits in the model's context a single
+    ``stuff`` call is used instead. Any other configured chain type is kept.
+    """
     settings = get_settings()
-    llm = ChatOpenAI(
+    if settings.summarize_prompt_name != "map_reduce":
+        return settings.summarize_prompt_name
+    if _count_tokens(documents, settings.openai_model) < settings.summarize_stuff_token_limit:
+        return "stuff"
+    return "map_reduce"
+
+
+def _build_llm(*, http_async_client: Optional[httpx.AsyncClient] = None) -> ChatOpenAI:
+    settings = get_settings()
+    return ChatOpenAI(
         openai_api_key=settings.openai_api_key,
         model=settings.openai_model,
         temperature=settings.temperature,
         max_tokens=settings.max_summary_tokens,
+        http_async_client=http_async_client,
     )
-    return load_summarize_chain(llm, chain_type=settings.summarize_prompt_name)
 
 
-def summarize_documents(documents: Iterable[Document]) -> str:
-    """Produce a concise summary for the provided documents."""
-    docs = list(documents)
-    if not docs:
-        return "No transcript available to summarize."
+def build_summarizer(
+    chain_type: Optional[str] = None,
+    *,
+    http_async_client: Optional[httpx.AsyncClient] = None,
+):
+    """Construct the LangChain summarize chain."""
+    settings = get_settings()
+    llm = _build_llm(http_async_client=http_async_client)
+    return load_summarize_chain(llm, chain_type=chain_type or settings.summarize_prompt_name)
+
 
-    chain = build_summarizer()
-    result = chain.invoke({"input_documents": docs})
+def _extract_summary(result) -> str:
     if isinstance(result, dict) and "output_text" in result:
         return result["output_text"].strip()
     if isinstance(result, str):
         return result.strip()
     return "Unable to generate summary."
+
+
+async def _asummarize(docs: List[Document], chain_type: str) -> str:
+    limit = get_settings().summarize_max_concurrency
+    # A client owned by this coroutine keeps pooled connections on the current
+    # event loop (the library default is shared process-wide). The legacy
+    # chain gathers every map call at once, so the connection pool size is
+    # what bounds how many requests are in flight.
+    async with httpx.AsyncClient(limits=httpx.Limits(max_connections=limit)) as http_client:
+        chain = build_summarizer(chain_type, http_async_client=http_client)
+        result = await chain.ainvoke({"input_documents": docs})
+    return _extract_summary(result)
+
+
+async def asummarize_documents(documents: Iterable[Document]) -> str:
+    """Async variant of ``summarize_documents``.
+
+    With ``map_reduce`` the per-chunk map calls are dispatched concurrently
+    instead of one after another.
+    """
+    docs = list(documents)
+    if not docs:
+        return "No transcript available to summarize."
+    return await _asummarize(docs, choose_chain_type(docs))
+
+
+def summarize_documents(documents: Iterable[Document]) -> str:
+    """Produce a concise summary for the provided documents."""
+    return asyncio.run(asummarize_documents(documents))
+
+
+def stream_summary(documents: Iterable[Document]) -> Iterator[str]:
+    """Yield the summary for the provided documents as it is generated.
+
+    A transcript that fits in context is summarized with one streamed call
+    over the ``stuff`` prompt. Multi-call chains such as ``map_reduce`` only
+    produce their final text, which is yielded in one piece.
+    """
+    docs = list(documents)
+    if not docs:
+        yield "No transcript available to summarize."
+        return
+
+    chain_type = choose_chain_type(docs)
+    if chain_type != "stuff":
+        yield asyncio.run(_asummarize(docs, chain_type))
+        return
+
+    text = _STUFF_SEPARATOR.join(doc.page_content for doc in docs)
+    for chunk in (STUFF_PROMPT | _build_llm()).stream({"text": text}):
+        if chunk.content:
+            yield str(chunk.content)
@@ -2,13 +2,48 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 
 from .config import get_settings
 
+_WS_RE = re.compile(r"\s+")
+_SEPARATORS = ["\n\n", "\n", ".", "?", "!", " "]
+# Chunk sizes are counted in tokens of this encoding, the unit the embedding
+# API bills by.
+CHUNK_ENCODING = "cl100k_base"
+# Bump whenever a change to preprocessing or splitting moves chunk boundaries,
+# so indexes cached under the old boundaries are not reused.
+CHUNKING_VERSION = "2"
+
+
+@lru_cache(maxsize=1)
+def _get_splitter() -> RecursiveCharacterTextSplitter:
+    """Splitter for the large chunks used as LLM context, built once."""
+    settings = get_settings()
+    return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        encoding_name=CHUNK_ENCODING,
+        chunk_size=settings.chunk_size,
+        chunk_overlap=settings.chunk_overlap,
+        separators=_SEPARATORS,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_child_splitter() -> RecursiveCharacterTextSplitter:
+    """Splitter for the small chunks used for retrieval, built once."""
+    settings = get_settings()
+    return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        encoding_name=CHUNK_ENCODING,
+        chunk_size=settings.child_chunk_size,
+        chunk_overlap=settings.child_chunk_overlap,
+        separators=_SEPARATORS,
+    )
+
 
 def build_documents(
     transcript_text: str,
@@ -16,21 +51,48 @@ def build_documents(
     metadata: Optional[Dict[str, str]] = None,
 ) -> List[Document]:
     """Split a transcript into chunked LangChain documents."""
+    # Collapse whitespace runs once so the splitter doesn't spend chunk budget
+    # on them.
+    transcript_text = _WS_RE.sub(" ", transcript_text or "").strip()
     if not transcript_text:
         return []
 
-    settings = get_settings()
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=settings.chunk_size,
-        chunk_overlap=settings.chunk_overlap,
-        separators=["\n\n", "\n", ".", "?", "!", " "],
-    )
-
     metadata = metadata or {}
-    docs = splitter.create_documents([transcript_text], metadatas=[metadata])
+    docs = _get_splitter().create_documents([transcript_text], metadatas=[metadata])
     # Ensure the video id remains on every chunk for tracing and caching.
     video_id = metadata.get("video_id")
     if video_id:
         for doc in docs:
             doc.metadata["video_id"] = video_id
+    # Number the chunks so retrieval over child chunks can map back to them.
+    for idx, doc in enumerate(docs):
+        doc.metadata["parent_id"] = idx
     return docs
+
+
+def restore_documents(
+    texts: Iterable[str],
+    *,
+    metadata: Optional[Dict[str, str]] = None,
+) -> List[Document]:
+    """Rebuild the documents produced by ``build_documents`` from their texts."""
+    metadata = metadata or {}
+    return [
+        Document(page_content=text, metadata={**metadata, "parent_id": idx})
+        for idx, text in enumerate(texts)
+    ]
+
+
+def build_child_documents(parents: Iterable[Document]) -> List[Document]:
+    """Split parent chunks into smaller children used for retrieval.
+
+    Each child carries its parent's ``parent_id`` so retrieval hits can be
+    mapped back to the larger chunk handed to the LLM.
+    """
+    splitter = _get_child_splitter()
+    children: List[Document] = []
+    for parent in parents:
+        children.extend(
+            splitter.create_documents([parent.page_content], metadatas=[parent.metadata])
+        )
+    return children
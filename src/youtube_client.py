@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Optional
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -18,7 +19,8 @@ from youtube_transcript_api import (  # type: ignore
 
 logger = logging.getLogger(__name__)
 
-_VIDEO_ID_PATTERN = re.compile(r"(?:(?:v=|\/)([0-9A-Za-z_-]{11}))")
+# Matches either a bare 11-character id or one embedded in a watch/short URL.
+_VIDEO_ID_PATTERN = re.compile(r"^([0-9A-Za-z_-]{11})$|(?:v=|\/)([0-9A-Za-z_-]{11})")
 
 
 @dataclass
@@ -78,11 +80,8 @@ class YouTubeClient:
         """Extract the 11-character YouTube video id from a URL or raw id."""
         if not url_or_id:
             return None
-        candidate = url_or_id.strip()
-        if len(candidate) == 11 and re.fullmatch(r"[0-9A-Za-z_-]{11}", candidate):
-            return candidate
-        match = _VIDEO_ID_PATTERN.search(candidate)
-        return match.group(1) if match else None
+        match = _VIDEO_ID_PATTERN.search(url_or_id.strip())
+        return (match.group(1) or match.group(2)) if match else None
 
     @staticmethod
     def fetch_transcript(
@@ -103,12 +102,10 @@ class YouTubeClient:
         except NoTranscriptFound as exc:
             raise RuntimeError("No transcript could be found for this video.") from exc
 
-        parts: List[str] = []
-        for chunk in transcript_list:
-            text = chunk.get("text")
-            if text:
-                parts.append(text.replace("\n", " ").strip())
-        return chunk_separator.join(parts)
+        texts = (chunk.get("text") for chunk in transcript_list)
+        return chunk_separator.join(
+            text.replace("\n", " ") for text in texts if text
+        )
 
 
 def get_metadata_and_transcript(
@@ -118,8 +115,14 @@ def get_metadata_and_transcript(
     languages: Optional[Iterable[str]] = None,
 ) -> Dict[str, Optional[str]]:
     """Convenience helper to fetch metadata and transcript in one call."""
-    metadata = client.get_video_metadata(video_id)
-    transcript_text = YouTubeClient.fetch_transcript(video_id, languages=languages)
+    # Both lookups are independent network calls, so run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        metadata_future = executor.submit(client.get_video_metadata, video_id)
+        transcript_future = executor.submit(
+            YouTubeClient.fetch_transcript, video_id, languages
+        )
+        metadata = metadata_future.result()
+        transcript_text = transcript_future.result()
     payload: Dict[str, Optional[str]] = {
         "transcript": transcript_text,
     }
@@ -0,0 +1,56 @@
+from typing import List
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from src.qa_chain import TinyVectorStore
+
+
+class FixedQueryEmbeddings(Embeddings):
+    """Returns the same query vector for every query."""
+
+    def __init__(self, query_vector: List[float]) -> None:
+        self.query_vector = query_vector
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        raise AssertionError("documents are embedded up front in these tests")
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.query_vector
+
+
+def _store(query_vector: List[float]) -> TinyVectorStore:
+    docs = [Document(page_content=name, metadata={"parent_id": i}) for i, name in enumerate("abc")]
+    vectors = [[1.0, 0.0], [3.0, 4.0], [0.0, 5.0]]
+    return TinyVectorStore.from_embeddings(vectors, docs, FixedQueryEmbeddings(query_vector))
+
+
+def _contents(docs: List[Document]) -> List[str]:
+    return [doc.page_content for doc in docs]
+
+
+def test_similarity_search_ranks_by_cosine_similarity():
+    # Unnormalized inputs: cosine scores against the query are c=1.0, b=0.8, a=0.0.
+    store = _store([0.0, 2.0])
+    assert _contents(store.similarity_search("q", k=2)) == ["c", "b"]
+
+
+def test_similarity_search_clamps_k():
+    store = _store([1.0, 0.0])
+    assert _contents(store.similarity_search("q", k=10)) == ["a", "b", "c"]
+    assert store.similarity_search("q", k=0) == []
+
+
+def test_save_and_load_round_trip(tmp_path):
+    store = _store([0.0, 2.0])
+    path = str(tmp_path / "index")
+    assert not TinyVectorStore.exists_local(path)
+
+    store.save_local(path)
+    store.save_local(path)  # overwriting an existing index works too
+
+    assert TinyVectorStore.exists_local(path)
+    loaded = TinyVectorStore.load_local(path, FixedQueryEmbeddings([0.0, 2.0]))
+    results = loaded.similarity_search("q", k=3)
+    assert _contents(results) == ["c", "b", "a"]
+    assert results[0].metadata == {"parent_id": 2}
@@ -0,0 +1,28 @@
+import pytest
+from langchain_core.documents import Document
+
+from src import summarizer
+from src.config import Settings
+
+DOCS = [Document(page_content="word " * 50) for _ in range(4)]
+
+
+def _use_settings(monkeypatch, **overrides):
+    settings = Settings(openai_api_key="test", youtube_api_key="test", **overrides)
+    monkeypatch.setattr(summarizer, "get_settings", lambda: settings)
+
+
+def test_choose_chain_type_stuffs_small_transcripts(monkeypatch):
+    _use_settings(monkeypatch, summarize_stuff_token_limit=10_000)
+    assert summarizer.choose_chain_type(DOCS) == "stuff"
+
+
+def test_choose_chain_type_map_reduces_large_transcripts(monkeypatch):
+    _use_settings(monkeypatch, summarize_stuff_token_limit=100)
+    assert summarizer.choose_chain_type(DOCS) == "map_reduce"
+
+
+@pytest.mark.parametrize("chain_type", ["refine", "stuff"])
+def test_choose_chain_type_keeps_explicit_setting(monkeypatch, chain_type):
+    _use_settings(monkeypatch, summarize_prompt_name=chain_type, summarize_stuff_token_limit=1)
+    assert summarizer.choose_chain_type(DOCS) == chain_type
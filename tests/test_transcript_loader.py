@@ -0,0 +1,24 @@
+from src.transcript_loader import build_documents, restore_documents
+
+METADATA = {"video_id": "dQw4w9WgXcQ", "title": "Title", "channel": "Channel"}
+TRANSCRIPT = " ".join(f"Sentence {i} explains another part of the topic." for i in range(300))
+
+
+def test_restore_documents_matches_build_documents():
+    built = build_documents(TRANSCRIPT, metadata=METADATA)
+    assert len(built) > 1
+
+    restored = restore_documents([doc.page_content for doc in built], metadata=METADATA)
+
+    assert [doc.page_content for doc in restored] == [doc.page_content for doc in built]
+    assert [doc.metadata for doc in restored] == [doc.metadata for doc in built]
+    assert [doc.metadata["parent_id"] for doc in restored] == list(range(len(built)))
+
+
+def test_build_documents_collapses_whitespace():
+    docs = build_documents("  Hello\n\n  world \t again  ", metadata=METADATA)
+    assert [doc.page_content for doc in docs] == ["Hello world again"]
+
+
+def test_build_documents_empty_transcript():
+    assert build_documents("   \n ", metadata=METADATA) == []
@@ -0,0 +1,21 @@
+import pytest
+
+from src.youtube_client import YouTubeClient
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("  dQw4w9WgXcQ\n", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ&t=42", "dQw4w9WgXcQ"),
+        ("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/shorts/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("", None),
+        ("too-short", None),
+        ("https://example.com/", None),
+    ],
+)
+def test_parse_video_id(value, expected):
+    assert YouTubeClient.parse_video_id(value) == expected